@@ -0,0 +1,152 @@
+"""Allocation benchmark for SubmissionIngest.
+
+Run from the repository root:
+
+    python -m api.bench_submission_ingest [--submissions 5000] [--seed 1]
+
+Builds a synthetic user.status history (problem tags fixed per problem, as on
+Codeforces) and reports tracemalloc peak bytes per submission for the previous
+per-endpoint loops (kept below as the baseline) and for the shared ingest with
+the dashboard and live-feature reductions on top.
+"""
+
+import argparse
+from collections import defaultdict
+import random
+import time
+import tracemalloc
+
+from api import main
+
+
+def _synthetic_submissions(count, seed):
+    rng = random.Random(seed)
+    tags = main._load_model_topics() + ["games", "interactive"]
+    verdicts = ["OK", "WRONG_ANSWER", "TIME_LIMIT_EXCEEDED", "RUNTIME_ERROR"]
+    problems = {}
+    submissions = []
+    for i in range(count):
+        contest_id = rng.choice([None] + list(range(1, 400)))
+        index = rng.choice("ABCDEF")
+        key = (contest_id, index) if contest_id is not None else i
+        problem = problems.setdefault(
+            key,
+            {
+                "contestId": contest_id,
+                "index": index,
+                "name": f"Problem {i}",
+                "tags": rng.sample(tags, rng.randint(0, 3)),
+            },
+        )
+        submissions.append(
+            {
+                "id": 100000 + i,
+                "creationTimeSeconds": 1700000000 + i,
+                "verdict": rng.choice(verdicts),
+                "problem": problem,
+            }
+        )
+    return submissions
+
+
+def _legacy_dashboard_loop(submissions):
+    solved_problem_keys = set()
+    topic_attempted = defaultdict(set)
+    topic_solved = defaultdict(set)
+    model_topics = set(main._load_model_topics())
+    for idx, sub in enumerate(submissions):
+        problem = sub.get("problem") or {}
+        contest_id = problem.get("contestId")
+        index = problem.get("index")
+        if contest_id is not None and index:
+            problem_key = f"{contest_id}-{index}"
+        else:
+            problem_key = f"misc-{idx}"
+        raw_tags = [str(t).strip().lower() for t in (problem.get("tags") or [])]
+        tags = [t for t in raw_tags if t in model_topics]
+        for topic in tags:
+            topic_attempted[topic].add(problem_key)
+        if (sub.get("verdict") or "UNKNOWN") == "OK":
+            solved_problem_keys.add(problem_key)
+            for topic in tags:
+                topic_solved[topic].add(problem_key)
+    return solved_problem_keys, topic_attempted, topic_solved
+
+
+def _legacy_live_loop(submissions):
+    model_topics = set(main._load_model_topics())
+    topic_stats = defaultdict(lambda: {"attempted": set(), "solved": set(), "submissions": 0})
+    solved_problem_keys = set()
+    per_problem = {}
+    for sub in submissions:
+        problem = sub.get("problem") or {}
+        contest_id = problem.get("contestId")
+        index = problem.get("index")
+        if contest_id is None or not index:
+            continue
+        problem_key = f"{contest_id}-{index}"
+        tags = set()
+        for t in problem.get("tags") or []:
+            lowered = str(t).strip().lower()
+            if lowered in model_topics:
+                tags.add(lowered)
+        if not tags:
+            continue
+        row = per_problem.setdefault(problem_key, {"tags": set(), "submissions": 0, "solved": False})
+        row["tags"].update(tags)
+        row["submissions"] += 1
+        if sub.get("verdict") == "OK":
+            row["solved"] = True
+            solved_problem_keys.add(problem_key)
+    for problem_key, meta in per_problem.items():
+        for topic in meta["tags"]:
+            topic_stats[topic]["attempted"].add(problem_key)
+            topic_stats[topic]["submissions"] += meta["submissions"]
+            if meta["solved"]:
+                topic_stats[topic]["solved"].add(problem_key)
+    return topic_stats, solved_problem_keys
+
+
+def _legacy(submissions):
+    return _legacy_dashboard_loop(submissions), _legacy_live_loop(submissions)
+
+
+def _ingest(submissions):
+    ingest = main.SubmissionIngest(submissions)
+    return (
+        ingest.topic_stats(),
+        ingest.solved_problem_keys(),
+        ingest.topic_stats(include_misc=False),
+        ingest.solved_problem_keys(include_misc=False),
+        ingest.recent_submissions(),
+    )
+
+
+def _measure(label, fn, submissions):
+    fn(submissions)  # warm lru caches so they do not count towards the peak
+    tracemalloc.start()
+    started = time.perf_counter()
+    result = fn(submissions)
+    elapsed = time.perf_counter() - started
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    print(
+        f"{label:<8} peak={peak:>9} B  per_submission={peak / len(submissions):>6.0f} B  "
+        f"time={elapsed * 1000:.1f} ms (traced)"
+    )
+
+
+def main_cli():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--submissions", type=int, default=main.SUBMISSION_FETCH_COUNT)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    submissions = _synthetic_submissions(args.submissions, args.seed)
+    _measure("legacy", _legacy, submissions)
+    _measure("ingest", _ingest, submissions)
+
+
+if __name__ == "__main__":
+    main_cli()
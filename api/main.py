@@ -1,16 +1,23 @@
+from array import array
+import base64
+from collections import OrderedDict
+import hashlib
+import hmac
 import os
-from collections import defaultdict
 from functools import lru_cache
 import math
 from pathlib import Path
+import threading
 import time
+from typing import Optional
 from urllib.parse import urlencode
 from urllib.request import urlopen
 import json
+import logging
 
 import bcrypt
 from dotenv import load_dotenv
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, Header, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 from pymongo import ASCENDING, MongoClient
@@ -19,6 +26,8 @@ from pydantic import BaseModel, EmailStr
 
 load_dotenv()
 
+logger = logging.getLogger(__name__)
+
 app = FastAPI(title="CP Mentor API")
 
 app.add_middleware(
@@ -43,13 +52,14 @@ class LoginPayload(BaseModel):
 
 
 class RecommendationsPayload(BaseModel):
-    codeforcesId: str
+    codeforcesId: str = ""
     perTopic: int = 3
     forceRefresh: bool = False
 
 
 class DashboardPayload(BaseModel):
-    codeforcesId: str
+    codeforcesId: str = ""
+    forceRefresh: bool = False
 
 
 DATASET_DIR = Path(__file__).resolve().parents[1] / "cf_dataset_ml"
@@ -61,6 +71,109 @@ CLUSTER_STATS_FILE = DATASET_DIR / "cluster_topic_problem_stats.csv"
 TRAINING_FEATURE_COLUMNS_FILE = DATASET_DIR / "training_feature_columns_v2.txt"
 
 
+DEFAULT_SESSION_TTL_SECONDS = 7 * 24 * 3600
+PLACEHOLDER_SESSION_SECRETS = {"", "change-me"}
+# Dev-only fallback when SESSION_SECRET is unset. It is per process, so tokens fail
+# across uvicorn workers and do not survive a restart; see check_session_secret().
+_FALLBACK_SESSION_SECRET = base64.urlsafe_b64encode(os.urandom(32)).decode("ascii")
+
+
+def _session_ttl_seconds():
+    ttl = _to_int(os.getenv("SESSION_TTL_SECONDS"), fallback=DEFAULT_SESSION_TTL_SECONDS)
+    return ttl if ttl > 0 else DEFAULT_SESSION_TTL_SECONDS
+
+
+def check_session_secret() -> None:
+    secret = (os.getenv("SESSION_SECRET") or "").strip()
+    if secret == "change-me":
+        raise RuntimeError("SESSION_SECRET is still the example value 'change-me'; set a random secret")
+    if secret:
+        return
+    if os.getenv("APP_ENV", "development").strip().lower() != "development":
+        raise RuntimeError("SESSION_SECRET must be set when APP_ENV is not 'development'")
+    logger.warning(
+        "SESSION_SECRET is not set; using a random per-process key. Session tokens will be "
+        "rejected by other workers and invalidated on restart. Set SESSION_SECRET before "
+        "running more than one worker."
+    )
+
+
+def _session_keys():
+    # SESSION_SECRET signs new tokens; SESSION_PREVIOUS_SECRETS (comma separated)
+    # keeps tokens issued before a key rotation verifiable until they expire.
+    current = (os.getenv("SESSION_SECRET") or "").strip()
+    if current in PLACEHOLDER_SESSION_SECRETS:
+        current = _FALLBACK_SESSION_SECRET
+    previous = [k.strip() for k in os.getenv("SESSION_PREVIOUS_SECRETS", "").split(",") if k.strip()]
+    return [current] + previous
+
+
+def _b64encode(raw: bytes):
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode("ascii")
+
+
+def _b64decode(text: str):
+    return base64.urlsafe_b64decode(text + "=" * (-len(text) % 4))
+
+
+def _sign(body: str, key: str):
+    return _b64encode(hmac.new(key.encode("utf-8"), body.encode("utf-8"), hashlib.sha256).digest())
+
+
+def _issue_session_token(user: dict):
+    now = int(time.time())
+    claims = {
+        "sub": user["id"],
+        "username": user["username"],
+        "cf": user["codeforces_id"],
+        "iat": now,
+        "exp": now + _session_ttl_seconds(),
+    }
+    body = _b64encode(json.dumps(claims, separators=(",", ":")).encode("utf-8"))
+    token = f"{body}.{_sign(body, _session_keys()[0])}"
+    return {"token": token, "token_type": "bearer", "expires_at": claims["exp"]}
+
+
+def _verify_session_token(token: str):
+    try:
+        body, signature = token.split(".")
+    except ValueError:
+        raise HTTPException(status_code=401, detail="Malformed session token")
+
+    signature_bytes = signature.encode("utf-8")
+    if not any(
+        hmac.compare_digest(signature_bytes, _sign(body, key).encode("ascii"))
+        for key in _session_keys()
+    ):
+        raise HTTPException(status_code=401, detail="Invalid session token")
+
+    try:
+        claims = json.loads(_b64decode(body))
+    except (ValueError, TypeError):
+        raise HTTPException(status_code=401, detail="Malformed session token")
+    if not isinstance(claims, dict) or not claims.get("cf"):
+        raise HTTPException(status_code=401, detail="Malformed session token")
+    if _to_int(claims.get("exp"), fallback=0) <= int(time.time()):
+        raise HTTPException(status_code=401, detail="Session token expired")
+    return claims
+
+
+def _session_from_header(authorization: Optional[str]):
+    if not authorization:
+        return None
+    scheme, _, token = authorization.partition(" ")
+    if scheme.lower() != "bearer" or not token.strip():
+        raise HTTPException(status_code=401, detail="Authorization header must be 'Bearer <token>'")
+    return _verify_session_token(token.strip())
+
+
+def _resolve_codeforces_id(payload_codeforces_id: str, authorization: Optional[str]):
+    claims = _session_from_header(authorization)
+    if claims is not None:
+        return claims["cf"]
+    return payload_codeforces_id.strip()
+
+
 def get_collection():
     mongo_uri = os.getenv(
         "MONGO_URI",
@@ -83,6 +196,7 @@ def init_collection() -> None:
 
 @app.on_event("startup")
 def on_startup() -> None:
+    check_session_secret()
     init_collection()
 
 
@@ -120,7 +234,11 @@ def signup(payload: SignUpPayload):
             "email": email,
             "codeforces_id": codeforces_id,
         }
-        return {"message": "User created successfully", "user": user}
+        return {
+            "message": "User created successfully",
+            "user": user,
+            "session": _issue_session_token(user),
+        }
     except DuplicateKeyError:
         raise HTTPException(status_code=409, detail="Email or Codeforces ID already exists")
     except Exception as exc:
@@ -153,14 +271,16 @@ def login(payload: LoginPayload):
                 content={"alert": "Invalid credentials. Please check email and password."},
             )
 
+        user_info = {
+            "id": str(user["_id"]),
+            "username": user["username"],
+            "email": user["email"],
+            "codeforces_id": user["codeforces_id"],
+        }
         return {
             "message": "Login successful",
-            "user": {
-                "id": str(user["_id"]),
-                "username": user["username"],
-                "email": user["email"],
-                "codeforces_id": user["codeforces_id"],
-            },
+            "user": user_info,
+            "session": _issue_session_token(user_info),
         }
     except HTTPException:
         raise
@@ -317,7 +437,236 @@ def _verdict_tone(verdict: str):
     return "yellow"
 
 
-def _build_dashboard_data(codeforces_id: str):
+SUBMISSION_FETCH_COUNT = 5000
+SUBMISSION_INGEST_TTL_SECONDS = 120
+SUBMISSION_INGEST_CACHE_SIZE = 256
+RECENT_SUBMISSIONS_LIMIT = 8
+
+# Verdicts documented for the Codeforces Submission object, pre-seeded so codes are
+# stable; anything new is appended under _verdict_lock.
+_VERDICT_NAMES = [
+    "OK",
+    "FAILED",
+    "PARTIAL",
+    "COMPILATION_ERROR",
+    "RUNTIME_ERROR",
+    "WRONG_ANSWER",
+    "PRESENTATION_ERROR",
+    "TIME_LIMIT_EXCEEDED",
+    "MEMORY_LIMIT_EXCEEDED",
+    "IDLENESS_LIMIT_EXCEEDED",
+    "SECURITY_VIOLATED",
+    "CRASHED",
+    "INPUT_PREPARATION_CRASHED",
+    "CHALLENGED",
+    "SKIPPED",
+    "TESTING",
+    "REJECTED",
+    "UNKNOWN",
+]
+_VERDICT_CODES = {name: code for code, name in enumerate(_VERDICT_NAMES)}
+_verdict_lock = threading.Lock()
+
+_submission_ingest_cache = OrderedDict()
+_submission_ingest_lock = threading.Lock()
+
+
+def _verdict_code(verdict: str):
+    code = _VERDICT_CODES.get(verdict)
+    if code is None:
+        with _verdict_lock:
+            code = _VERDICT_CODES.get(verdict)
+            if code is None:
+                code = len(_VERDICT_NAMES)
+                _VERDICT_NAMES.append(verdict)
+                _VERDICT_CODES[verdict] = code
+    return code
+
+
+@lru_cache(maxsize=1)
+def _load_model_topic_ids():
+    return {topic: i for i, topic in enumerate(_load_model_topics())}
+
+
+class SubmissionIngest:
+    """Columnar view of a user.status response, parsed once per fetch.
+
+    Per-submission data lives in flat arrays indexed by submission row; anything
+    that only depends on the problem (key, name, tags) is stored once per
+    distinct problem and referenced by problem id.
+    """
+
+    __slots__ = (
+        "problem_ids",
+        "verdicts",
+        "timestamps",
+        "submission_ids",
+        "problem_keys",
+        "problem_contest_ids",
+        "problem_names",
+        "problem_tag_ids",
+        "problem_first_raw_tag",
+        "problem_is_misc",
+        "fetched_at",
+        "_problem_stats",
+    )
+
+    def __init__(self, submissions, fetched_at=None):
+        topic_ids = _load_model_topic_ids()
+        problem_lookup = {}
+
+        self.fetched_at = time.time() if fetched_at is None else fetched_at
+        self._problem_stats = None
+
+        self.problem_ids = array("i")
+        self.verdicts = array("H")
+        self.timestamps = array("q")
+        self.submission_ids = array("q")
+        self.problem_keys = []
+        self.problem_contest_ids = []
+        self.problem_names = []
+        self.problem_tag_ids = []
+        self.problem_first_raw_tag = []
+        self.problem_is_misc = bytearray()
+
+        for idx, sub in enumerate(submissions):
+            problem = sub.get("problem") or {}
+            contest_id = problem.get("contestId")
+            index = problem.get("index")
+            is_misc = contest_id is None or not index
+            lookup_key = idx if is_misc else (contest_id, index)
+
+            problem_id = problem_lookup.get(lookup_key)
+            if problem_id is None:
+                problem_id = len(self.problem_keys)
+                problem_lookup[lookup_key] = problem_id
+                problem_key = f"misc-{idx}" if is_misc else f"{contest_id}-{index}"
+                raw_tags = [str(t).strip().lower() for t in (problem.get("tags") or [])]
+                tag_ids = []
+                for tag in raw_tags:
+                    tag_id = topic_ids.get(tag)
+                    if tag_id is not None and tag_id not in tag_ids:
+                        tag_ids.append(tag_id)
+                self.problem_keys.append(problem_key)
+                self.problem_contest_ids.append(contest_id)
+                self.problem_names.append(problem.get("name") or problem_key)
+                self.problem_tag_ids.append(tuple(tag_ids))
+                self.problem_first_raw_tag.append(raw_tags[0] if raw_tags else None)
+                self.problem_is_misc.append(1 if is_misc else 0)
+
+            self.problem_ids.append(problem_id)
+            self.verdicts.append(_verdict_code(sub.get("verdict") or "UNKNOWN"))
+            self.timestamps.append(_to_int(sub.get("creationTimeSeconds"), fallback=-1))
+            self.submission_ids.append(_to_int(sub.get("id"), fallback=-1))
+
+    def __len__(self):
+        return len(self.problem_ids)
+
+    def problem_stats(self):
+        """Return per-problem (submission counts, solved flags), computed once per ingest."""
+        if self._problem_stats is not None:
+            return self._problem_stats
+        counts = array("i", bytes(4 * len(self.problem_keys)))
+        solved = bytearray(len(self.problem_keys))
+        ok = _VERDICT_CODES["OK"]
+        for problem_id, verdict in zip(self.problem_ids, self.verdicts):
+            counts[problem_id] += 1
+            if verdict == ok:
+                solved[problem_id] = 1
+        self._problem_stats = (counts, solved)
+        return self._problem_stats
+
+    def solved_problem_keys(self, include_misc=True):
+        _, solved = self.problem_stats()
+        return {
+            self.problem_keys[problem_id]
+            for problem_id, flag in enumerate(solved)
+            if flag and (include_misc or not self.problem_is_misc[problem_id])
+        }
+
+    def topic_stats(self, include_misc=True):
+        """Return per-topic-id (attempted unique, solved unique, submissions) arrays."""
+        topic_count = len(_load_model_topics())
+        attempted = [0] * topic_count
+        solved_unique = [0] * topic_count
+        submissions = [0] * topic_count
+        counts, solved = self.problem_stats()
+        for problem_id, tag_ids in enumerate(self.problem_tag_ids):
+            if not tag_ids or (not include_misc and self.problem_is_misc[problem_id]):
+                continue
+            for tag_id in tag_ids:
+                attempted[tag_id] += 1
+                submissions[tag_id] += counts[problem_id]
+                if solved[problem_id]:
+                    solved_unique[tag_id] += 1
+        return attempted, solved_unique, submissions
+
+    def recent_submissions(self, limit=RECENT_SUBMISSIONS_LIMIT):
+        model_topics = _load_model_topics()
+        now = int(time.time())
+        rows = []
+        for row in range(min(limit, len(self))):
+            problem_id = self.problem_ids[row]
+            verdict = _VERDICT_NAMES[self.verdicts[row]]
+            tag_ids = self.problem_tag_ids[problem_id]
+            topic_label = "Other"
+            if tag_ids:
+                topic_label = _to_title_case(model_topics[tag_ids[0]])
+            elif self.problem_first_raw_tag[problem_id]:
+                topic_label = _to_title_case(self.problem_first_raw_tag[problem_id])
+            submission_url = ""
+            contest_id = self.problem_contest_ids[problem_id]
+            submission_id = self.submission_ids[row]
+            if contest_id is not None and submission_id >= 0:
+                submission_url = (
+                    f"https://codeforces.com/contest/{contest_id}/submission/{submission_id}"
+                )
+            timestamp = self.timestamps[row]
+            rows.append(
+                {
+                    "name": self.problem_names[problem_id],
+                    "topic": topic_label,
+                    "verdict": verdict.replace("_", " ").title(),
+                    "tone": _verdict_tone(verdict),
+                    "time": _time_ago_label(timestamp if timestamp >= 0 else now),
+                    "view_url": submission_url,
+                }
+            )
+        return rows
+
+
+def _get_submission_ingest(codeforces_id: str, force_refresh: bool = False):
+    # Dashboard and recommendations usually hit back-to-back for the same handle,
+    # so a short-lived cache lets them share a single user.status fetch.
+    cache_key = codeforces_id.lower()
+    if not force_refresh:
+        with _submission_ingest_lock:
+            cached = _submission_ingest_cache.get(cache_key)
+        if cached is not None and time.time() - cached.fetched_at < SUBMISSION_INGEST_TTL_SECONDS:
+            return cached
+
+    submissions = _cf_api_get(
+        "user.status", handle=codeforces_id, **{"from": 1, "count": SUBMISSION_FETCH_COUNT}
+    )
+    ingest = SubmissionIngest(submissions)
+
+    with _submission_ingest_lock:
+        now = time.time()
+        expired = [
+            key
+            for key, cached in _submission_ingest_cache.items()
+            if now - cached.fetched_at >= SUBMISSION_INGEST_TTL_SECONDS
+        ]
+        for key in expired:
+            del _submission_ingest_cache[key]
+        _submission_ingest_cache[cache_key] = ingest
+        _submission_ingest_cache.move_to_end(cache_key)
+        while len(_submission_ingest_cache) > SUBMISSION_INGEST_CACHE_SIZE:
+            _submission_ingest_cache.popitem(last=False)
+    return ingest
+
+
+def _build_dashboard_data(codeforces_id: str, force_refresh: bool = False):
     profile_rows = _cf_api_get("user.info", handles=codeforces_id)
     if not profile_rows:
         raise ValueError(f"Codeforces user '{codeforces_id}' not found")
@@ -337,63 +686,13 @@ def _build_dashboard_data(codeforces_id: str):
     except Exception:
         rating_delta = 0
 
-    submissions = _cf_api_get("user.status", handle=codeforces_id, **{"from": 1, "count": 500})
-
-    solved_problem_keys = set()
-    topic_attempted = defaultdict(set)
-    topic_solved = defaultdict(set)
-    recent_submissions = []
-    model_topics = set(_load_model_topics())
-
-    for idx, sub in enumerate(submissions):
-        problem = sub.get("problem") or {}
-        contest_id = problem.get("contestId")
-        index = problem.get("index")
-        if contest_id is not None and index:
-            problem_key = f"{contest_id}-{index}"
-        else:
-            problem_key = f"misc-{idx}"
-
-        raw_tags = [str(t).strip().lower() for t in (problem.get("tags") or [])]
-        tags = [t for t in raw_tags if t in model_topics]
-        for topic in tags:
-            topic_attempted[topic].add(problem_key)
-
-        verdict = sub.get("verdict") or "UNKNOWN"
-        if verdict == "OK":
-            solved_problem_keys.add(problem_key)
-            for topic in tags:
-                topic_solved[topic].add(problem_key)
-
-        if len(recent_submissions) < 8:
-            topic_label = "Other"
-            if tags:
-                topic_label = _to_title_case(tags[0])
-            elif raw_tags:
-                topic_label = _to_title_case(raw_tags[0])
-            submission_url = ""
-            submission_id = sub.get("id")
-            if contest_id is not None and submission_id is not None:
-                submission_url = (
-                    f"https://codeforces.com/contest/{contest_id}/submission/{submission_id}"
-                )
-            recent_submissions.append(
-                {
-                    "name": problem.get("name") or problem_key,
-                    "topic": topic_label,
-                    "verdict": verdict.replace("_", " ").title(),
-                    "tone": _verdict_tone(verdict),
-                    "time": _time_ago_label(
-                        _to_int(sub.get("creationTimeSeconds"), fallback=int(time.time()))
-                    ),
-                    "view_url": submission_url,
-                }
-            )
+    ingest = _get_submission_ingest(codeforces_id, force_refresh=force_refresh)
+    attempted, solved, _ = ingest.topic_stats()
 
     topic_accuracy = []
-    for topic in sorted(model_topics):
-        attempt_count = len(topic_attempted[topic])
-        solved_count = len(topic_solved[topic])
+    for topic_id, topic in enumerate(_load_model_topics()):
+        attempt_count = attempted[topic_id]
+        solved_count = solved[topic_id]
         acc = int(round((solved_count / attempt_count) * 100)) if attempt_count > 0 else 0
         topic_accuracy.append({"topic": _to_title_case(topic), "value": acc, "attempted": attempt_count})
 
@@ -411,59 +710,26 @@ def _build_dashboard_data(codeforces_id: str):
         "rating_delta": rating_delta,
         "friend_of_count": _to_int(profile.get("friendOfCount"), fallback=0),
         "contribution": _to_int(profile.get("contribution"), fallback=0),
-        "problems_solved": len(solved_problem_keys),
+        "problems_solved": len(ingest.solved_problem_keys()),
         "topic_accuracy": topic_accuracy,
-        "recent_submissions": recent_submissions,
-        "last_synced": int(time.time()),
+        "recent_submissions": ingest.recent_submissions(),
+        "last_synced": int(ingest.fetched_at),
     }
 
 
-def _build_live_user_features(codeforces_id: str):
-    model_topics = set(_load_model_topics())
-    topic_stats = defaultdict(lambda: {"attempted": set(), "solved": set(), "submissions": 0})
-    solved_problem_keys = set()
-
+def _build_live_user_features(codeforces_id: str, force_refresh: bool = False):
     profile_rows = _cf_api_get("user.info", handles=codeforces_id)
     user_profile = profile_rows[0] if profile_rows else {}
     rating = _to_float(user_profile.get("rating"), fallback=0.0)
 
-    submissions = _cf_api_get("user.status", handle=codeforces_id, **{"from": 1, "count": 5000})
-    per_problem = {}
-    for sub in submissions:
-        problem = sub.get("problem") or {}
-        contest_id = problem.get("contestId")
-        index = problem.get("index")
-        if contest_id is None or not index:
-            continue
-
-        problem_key = f"{contest_id}-{index}"
-        tags = set()
-        for t in problem.get("tags") or []:
-            lowered = str(t).strip().lower()
-            if lowered in model_topics:
-                tags.add(lowered)
-        if not tags:
-            continue
-
-        row = per_problem.setdefault(problem_key, {"tags": set(), "submissions": 0, "solved": False})
-        row["tags"].update(tags)
-        row["submissions"] += 1
-        if sub.get("verdict") == "OK":
-            row["solved"] = True
-            solved_problem_keys.add(problem_key)
-
-    for problem_key, meta in per_problem.items():
-        for topic in meta["tags"]:
-            topic_stats[topic]["attempted"].add(problem_key)
-            topic_stats[topic]["submissions"] += meta["submissions"]
-            if meta["solved"]:
-                topic_stats[topic]["solved"].add(problem_key)
+    ingest = _get_submission_ingest(codeforces_id, force_refresh=force_refresh)
+    attempted, solved, submissions = ingest.topic_stats(include_misc=False)
 
     topic_rows = []
-    for topic in _load_model_topics():
-        attempted_unique = len(topic_stats[topic]["attempted"])
-        solved_unique = len(topic_stats[topic]["solved"])
-        submissions_count = int(topic_stats[topic]["submissions"])
+    for topic_id, topic in enumerate(_load_model_topics()):
+        attempted_unique = attempted[topic_id]
+        solved_unique = solved[topic_id]
+        submissions_count = submissions[topic_id]
         accuracy = (solved_unique / attempted_unique) if attempted_unique > 0 else 0.0
         struggle = submissions_count / max(solved_unique, 1)
 
@@ -479,7 +745,7 @@ def _build_live_user_features(codeforces_id: str):
             }
         )
 
-    return rating, topic_rows, solved_problem_keys
+    return rating, topic_rows, ingest.solved_problem_keys(include_misc=False)
 
 
 def _build_feature_vector(topic_rows, rating):
@@ -594,9 +860,20 @@ def _recommend_for_topic(cluster, topic, solved_problem_keys, user_rating, per_t
     return candidates[:per_topic]
 
 
+@app.post("/api/session/refresh")
+def refresh_session(authorization: Optional[str] = Header(default=None)):
+    claims = _session_from_header(authorization)
+    if claims is None:
+        raise HTTPException(status_code=401, detail="Session token is required")
+    user = {"id": claims["sub"], "username": claims["username"], "codeforces_id": claims["cf"]}
+    return {"session": _issue_session_token(user)}
+
+
 @app.post("/api/recommendations/weak-topics")
-def weak_topic_recommendations(payload: RecommendationsPayload):
-    codeforces_id = payload.codeforcesId.strip()
+def weak_topic_recommendations(
+    payload: RecommendationsPayload, authorization: Optional[str] = Header(default=None)
+):
+    codeforces_id = _resolve_codeforces_id(payload.codeforcesId, authorization)
     per_topic = max(1, min(payload.perTopic, 10))
     if not codeforces_id:
         raise HTTPException(status_code=400, detail="codeforcesId is required")
@@ -628,7 +905,9 @@ def weak_topic_recommendations(payload: RecommendationsPayload):
 
     if not topic_rows:
         try:
-            user_rating, topic_rows, solved_problem_keys = _build_live_user_features(codeforces_id)
+            user_rating, topic_rows, solved_problem_keys = _build_live_user_features(
+                codeforces_id, force_refresh=payload.forceRefresh
+            )
             cluster = _predict_cluster_from_features(topic_rows, user_rating)
             source = "live_codeforces_fallback"
         except Exception as exc:
@@ -672,11 +951,11 @@ def weak_topic_recommendations(payload: RecommendationsPayload):
 
 
 @app.post("/api/dashboard")
-def dashboard(payload: DashboardPayload):
-    codeforces_id = payload.codeforcesId.strip()
+def dashboard(payload: DashboardPayload, authorization: Optional[str] = Header(default=None)):
+    codeforces_id = _resolve_codeforces_id(payload.codeforcesId, authorization)
     if not codeforces_id:
         raise HTTPException(status_code=400, detail="codeforcesId is required")
     try:
-        return _build_dashboard_data(codeforces_id)
+        return _build_dashboard_data(codeforces_id, force_refresh=payload.forceRefresh)
     except Exception as exc:
         raise HTTPException(status_code=404, detail=f"Dashboard data fetch failed: {exc}")
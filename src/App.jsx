@@ -34,6 +34,16 @@ const formatTopicLabel = (topic) =>
     .map((word) => (word ? word[0].toUpperCase() + word.slice(1) : word))
     .join(" ");
 
+const withSession = (data) =>
+  data?.user
+    ? { ...data.user, session_token: data.session?.token, session_expires_at: data.session?.expires_at }
+    : null;
+
+const authHeaders = (authUser) => ({
+  "Content-Type": "application/json",
+  ...(authUser?.session_token ? { Authorization: `Bearer ${authUser.session_token}` } : {}),
+});
+
 const difficultyFromRating = (rating) => {
   const value = Number(rating);
   if (!Number.isFinite(value) || value <= 0) {
@@ -81,7 +91,7 @@ function SignUpPage({ onGoToLogin, onAuthSuccess }) {
         return;
       }
 
-      onAuthSuccess(data?.user ?? null);
+      onAuthSuccess(withSession(data));
     } catch {
       setErrorMessage("Cannot reach backend API. Start FastAPI with `python -m uvicorn api.main:app --reload --port 5000`.");
     } finally {
@@ -262,7 +272,7 @@ function LoginPage({ onGoToSignup, onAuthSuccess }) {
         return;
       }
 
-      onAuthSuccess(data?.user ?? null);
+      onAuthSuccess(withSession(data));
     } catch {
       setErrorMessage("Cannot reach backend API. Start FastAPI with `python -m uvicorn api.main:app --reload --port 5000`.");
     } finally {
@@ -401,13 +411,14 @@ function DashboardPage({
   authUser,
   cachedDashboard,
   onDashboardData,
+  onSessionExpired,
 }) {
   const [dashboardData, setDashboardData] = useState(null);
   const [dashboardLoading, setDashboardLoading] = useState(false);
   const [dashboardError, setDashboardError] = useState("");
   const activeDashboardRequestRef = useRef(null);
 
-  const fetchDashboard = useCallback(async ({ silent = false } = {}) => {
+  const fetchDashboard = useCallback(async ({ silent = false, forceRefresh = false } = {}) => {
     const codeforcesId = authUser?.codeforces_id;
     if (!codeforcesId) return;
 
@@ -424,13 +435,17 @@ function DashboardPage({
     try {
       const response = await fetch("/api/dashboard", {
         method: "POST",
-        headers: { "Content-Type": "application/json" },
-        body: JSON.stringify({ codeforcesId }),
+        headers: authHeaders(authUser),
+        body: JSON.stringify({ codeforcesId, forceRefresh }),
         signal: controller.signal,
       });
 
       const contentType = response.headers.get("content-type") || "";
       const data = contentType.includes("application/json") ? await response.json() : null;
+      if (response.status === 401) {
+        onSessionExpired?.();
+        return;
+      }
       if (!response.ok) {
         throw new Error(data?.detail || `Unable to load dashboard (HTTP ${response.status})`);
       }
@@ -449,7 +464,7 @@ function DashboardPage({
         setDashboardLoading(false);
       }
     }
-  }, [authUser?.codeforces_id, onDashboardData]);
+  }, [authUser?.codeforces_id, authUser?.session_token, onDashboardData, onSessionExpired]);
 
   useEffect(() => {
     if (cachedDashboard && cachedDashboard.codeforces_id === authUser?.codeforces_id) {
@@ -562,7 +577,7 @@ function DashboardPage({
         <button
           className="flex h-10 w-10 items-center justify-center rounded-full bg-slate-100 dark:bg-slate-800 disabled:opacity-60"
           disabled={dashboardLoading || !authUser?.codeforces_id}
-          onClick={fetchDashboard}
+          onClick={() => fetchDashboard({ forceRefresh: true })}
           type="button"
         >
           <span className="material-symbols-outlined">sync</span>
@@ -583,7 +598,7 @@ function DashboardPage({
           <button
             className="hidden items-center gap-2 rounded-lg bg-primary px-4 py-2 text-sm font-bold text-white transition-opacity hover:opacity-90 disabled:opacity-70 md:flex"
             disabled={dashboardLoading || !authUser?.codeforces_id}
-            onClick={fetchDashboard}
+            onClick={() => fetchDashboard({ forceRefresh: true })}
             type="button"
           >
             <span className="material-symbols-outlined text-sm">sync</span>
@@ -760,6 +775,7 @@ function PersonalizedSheetPage({
   authUser,
   cachedSheet,
   onSheetData,
+  onSessionExpired,
 }) {
   const [sheetData, setSheetData] = useState(null);
   const [loading, setLoading] = useState(false);
@@ -775,12 +791,16 @@ function PersonalizedSheetPage({
     try {
       const response = await fetch("/api/recommendations/weak-topics", {
         method: "POST",
-        headers: { "Content-Type": "application/json" },
+        headers: authHeaders(authUser),
         body: JSON.stringify({ codeforcesId, perTopic: 5, forceRefresh }),
       });
 
       const contentType = response.headers.get("content-type") || "";
       const data = contentType.includes("application/json") ? await response.json() : null;
+      if (response.status === 401) {
+        onSessionExpired?.();
+        return;
+      }
       if (!response.ok) {
         throw new Error(data?.detail || `Unable to generate sheet (HTTP ${response.status})`);
       }
@@ -1603,6 +1623,43 @@ function App() {
   const [sheetCacheByUser, setSheetCacheByUser] = useState({});
   const [dashboardCacheByUser, setDashboardCacheByUser] = useState({});
 
+  const handleSessionExpired = useCallback(() => {
+    setAuthUser(null);
+    setPage("login");
+  }, []);
+
+  useEffect(() => {
+    const token = authUser?.session_token;
+    const expiresAt = authUser?.session_expires_at;
+    if (!token || !expiresAt) return undefined;
+
+    // Rotate the token once half of its remaining lifetime has passed.
+    const delay = Math.min(Math.max(0, (expiresAt * 1000 - Date.now()) / 2), 2 ** 31 - 1);
+    const timer = setTimeout(async () => {
+      try {
+        const response = await fetch("/api/session/refresh", {
+          method: "POST",
+          headers: authHeaders(authUser),
+        });
+        if (response.status === 401) {
+          handleSessionExpired();
+          return;
+        }
+        const data = response.ok ? await response.json() : null;
+        if (data?.session?.token) {
+          setAuthUser((prev) =>
+            prev
+              ? { ...prev, session_token: data.session.token, session_expires_at: data.session.expires_at }
+              : prev
+          );
+        }
+      } catch {
+        // Network failure: the next authenticated call will surface the error.
+      }
+    }, delay);
+    return () => clearTimeout(timer);
+  }, [authUser, handleSessionExpired]);
+
   if (page === "dashboard") {
     const dashboardCacheKey = authUser?.codeforces_id || "";
     return (
@@ -1617,6 +1674,7 @@ function App() {
         onOpenPersonalizedContest={() => setPage("personalized-contest")}
         onOpenPersonalizedSheet={() => setPage("personalized-sheet")}
         onOpenUpcoming={() => setPage("upcoming-contest")}
+        onSessionExpired={handleSessionExpired}
       />
     );
   }
@@ -1635,6 +1693,7 @@ function App() {
         onGoDashboard={() => setPage("dashboard")}
         onOpenPersonalizedContest={() => setPage("personalized-contest")}
         onOpenUpcoming={() => setPage("upcoming-contest")}
+        onSessionExpired={handleSessionExpired}
       />
     );
   }